@@ -4,7 +4,7 @@
 Functions/classes to access and/or modify the attributes of any object(s).
 Greg Conan: gregmconan@gmail.com
 Created: 2025-06-02
-Updated: 2026-03-02
+Updated: 2026-10-18
 """
 # Import standard libraries
 from collections.abc import Callable, Container, Generator, Iterable, Iterator
@@ -360,10 +360,11 @@ class AttrsOf(IterableMap):
                                 names an attribute of the first; etc.
         :return: Any, the attribute of an attribute ... of an attribute of an_obj
         """
-        attributes = list(attribute_names)  # TODO reversed(attribute_names) ?
         to_return = self.what
-        while attributes and to_return is not None:
-            to_return = getattr(to_return, attributes.pop(0), None)
+        for attr_name in attribute_names:
+            if to_return is None:
+                break
+            to_return = getattr(to_return, attr_name, None)
         return to_return
 
     # TODO: @cached_property[_IterAttrPairs]  # or [list[tuple[str, Any]]]?
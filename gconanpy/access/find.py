@@ -5,12 +5,13 @@ Classes and functions that iterate and then break once they find what \
     they're looking for.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-04-02
-Updated: 2026-03-02
+Updated: 2026-10-18
 """
 # Import standard libraries
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, \
+    Sequence
+from functools import partial
 # from more_itertools import iter_except  # TODO?
-import operator
 import sys
 from typing import Any, Self, TypeVar
 
@@ -35,18 +36,50 @@ IterfindDefault = TypeVar("IterfindDefault")  # Default iterfind return
 StrChecker = Callable[[str | None], bool] | Callable[[str], bool]
 
 
+def _append_args(func: Callable, args: Iterable,
+                 kwargs: Mapping[str, Any] = {}) -> Callable[[Any], Any]:
+    """ Splatting even an empty tuple into a call (`func(x, *args)`) is \
+        several times slower than a plain call, so bind `args` once here.
+
+    :param func: Callable[[Any, *args], Any], function to wrap
+    :param args: Iterable of positional arguments to pass into `func` \
+        after its first argument
+    :param kwargs: Mapping[str, Any] of keyword arguments to pass into `func`
+    :return: Callable[[Any], Any], `func` itself if `args` and `kwargs` \
+        are empty; else a function calling `func(x, *args, **kwargs)`
+    """
+    args = tuple(args)
+    if kwargs:
+        return (lambda x: func(x, *args, **kwargs)) if args \
+            else partial(func, **kwargs)
+    match len(args):
+        case 0:
+            return func
+        case 1:
+            arg = args[0]
+            return lambda x: func(x, arg)
+        case _:
+            return lambda x: func(x, *args)
+
+
 def iterfind(find_in: Iterable[IterfindItem],
              found_if: Callable = is_not_none,
              found_args: Iterable = [],
              found_kwargs: Mapping[str, Any] = {},
              default: IterfindDefault = None, element_is_arg: bool = True
              ) -> IterfindItem | IterfindDefault:
-    for each_item in find_in:
-        args = [each_item, *found_args] if element_is_arg else found_args
-        if found_if(*args, **found_kwargs):
-            return each_item
-    else:
-        return default
+    if element_is_arg:
+        if found_args or found_kwargs:
+            found_if = _append_args(found_if, found_args, found_kwargs)
+        for each_item in find_in:
+            if found_if(each_item):
+                return each_item
+    else:  # found_if may check state that changes as find_in is iterated
+        found_args = tuple(found_args)
+        for each_item in find_in:
+            if found_if(*found_args, **found_kwargs):
+                return each_item
+    return default
 
 
 def modifind(find_in: Iterable,
@@ -55,22 +88,50 @@ def modifind(find_in: Iterable,
              found_if: Callable = is_not_none,
              found_args: Iterable = [],
              default: Any = None,
-             errs: Iterable[type[BaseException]] = [
-                 *DATA_ERRORS, UnboundLocalError]) -> Any:
-    i = 0
-    is_found = False
-    iter_over = list(find_in)
-    while not is_found and i < len(iter_over):
-        with IgnoreExceptions(*errs):
-            modified = modify(iter_over[i], *modify_args
-                              ) if modify else iter_over[i]
-        with IgnoreExceptions(*errs):
-            is_found = found_if(modified, *found_args)
-        i += 1
-    return modified if is_found else default
+             errs: Iterable[type[BaseException]] = DATA_ERRORS) -> Any:
+    catch = tuple(errs) or DATA_ERRORS  # IgnoreExceptions() default
+
+    # By default, check for None inline instead of calling is_not_none
+    check_none = found_if is is_not_none and not found_args
+    if found_args:
+        found_if = _append_args(found_if, found_args)
+
+    if modify is None:  # Skip the per-item modify check if it's unneeded
+        if check_none:
+            for each_item in find_in:
+                if each_item is not None:
+                    return each_item
+            return default
+        for each_item in find_in:
+            try:
+                if found_if(each_item):
+                    return each_item
+            except catch:
+                pass
+    else:
+        if modify_args:
+            modify = _append_args(modify, modify_args)
+        if check_none:
+            for each_item in find_in:
+                try:
+                    modified = modify(each_item)
+                except catch:
+                    continue
+                if modified is not None:
+                    return modified
+            return default
+        for each_item in find_in:
+            try:
+                modified = modify(each_item)
+                if found_if(modified):
+                    return modified
+            except catch:
+                pass
+    return default
 
 
 class Spliterator:
+    __slots__ = ("max_len", "min_parts")
     _Target = TypeVar("_Target")
 
     def __init__(self, *, max_len: int = sys.maxunicode, min_parts: int = 1
@@ -87,8 +148,10 @@ class Spliterator:
         :param parts: list[str] to iteratively modify, check, and recombine
         :param join_on: str, delimiter to insert between `parts`; \
             defaults to " "
-        :param max_len: int, _description_
-        :param min_parts: int, _description_
+        :param max_len: int, maximum length of the recombined string; \
+            defaults to `self.max_len`
+        :param min_parts: int, minimum number of `parts` to keep; \
+            defaults to `self.min_parts`
         :param get_target: Callable[[str | None], bool], function that \
             returns None unless `join_on.join(parts)` is ready to return; \
             defaults to `always_none`
@@ -101,13 +164,25 @@ class Spliterator:
         min_parts = min_parts or self.min_parts
 
         gotten = get_target(parts[pop_ix])
-        rejoined = join_on.join(parts)
-        while gotten is None and len(rejoined) > max_len and \
-                min_parts < len(parts):
-            parts.pop(pop_ix)
-            gotten = get_target(parts[pop_ix])
-            rejoined = join_on.join(parts)
-        return rejoined, gotten
+
+        # Track the length of join_on.join(parts) instead of rebuilding it
+        sep_len = len(join_on)
+        joined_len = sum(map(len, parts)) + sep_len * (len(parts) - 1)
+        if pop_ix == 0:  # Advance a start index instead of shifting parts
+            start = 0
+            n_parts = len(parts)
+            while gotten is None and joined_len > max_len and \
+                    min_parts < n_parts - start:
+                joined_len -= len(parts[start]) + sep_len
+                start += 1
+                gotten = get_target(parts[start])
+            del parts[:start]
+        else:
+            while gotten is None and joined_len > max_len and \
+                    min_parts < len(parts):
+                joined_len -= len(parts.pop(pop_ix)) + sep_len
+                gotten = get_target(parts[pop_ix])
+        return join_on.join(parts), gotten
 
 
 class UntilFound(WrapFunction):
@@ -121,6 +196,8 @@ class UntilFound(WrapFunction):
 
 class BasicRange(Iterable[Item]):
     """ Iterator like range(); base class for custom iterators to extend. """
+    __slots__ = ("end", "is_forward", "is_iterating", "ix", "start", "step",
+                 "to_iter")
     # _I = TypeVar("_I")
 
     def __init__(self, iter_over: Sequence[Item],  # Sequence[_I],
@@ -137,22 +214,24 @@ class BasicRange(Iterable[Item]):
         self.is_iterating = True
         self.ix = start_at
         self.start = start_at
-        abs_step = abs(step)
-        self.step, self.not_yet_at = (-abs_step, operator.ge) if \
-            self.start > self.end else (abs_step, operator.lt)
+        self.is_forward = self.start <= self.end
+        self.step = abs(step) if self.is_forward else -abs(step)
         self.to_iter = iter_over
 
     def __getitem__(self, ix: int) -> Item:
         return self.to_iter[ix]
 
-    def __iter__(self) -> Self:
-        """ Reset variables to start iterating.
+    def __iter__(self) -> Iterator[Item]:
+        """ Iterate from `start` through `end` without the bookkeeping \
+            that `__next__` does for callers who poll `is_iterating`. \
+            Subclasses that are polled with `next()` (e.g. `ReadyChecker`) \
+            override this to return themselves, so that `iter(self) is self`.
 
-        :return: BasicRange, self
+        :return: Iterator[Item] over the elements between `start` and `end`
         """
-        self.is_iterating = True
-        self.ix = self.start
-        return self
+        return map(self.to_iter.__getitem__,
+                   range(self.start, self.end + (1 if self.is_forward else -1),
+                         self.step))
 
     def __len__(self) -> int:
         """
@@ -166,7 +245,7 @@ class BasicRange(Iterable[Item]):
         :return: Any, the next element of the Sequence being iterated over.
         """
         if self.is_iterating:
-            next_value = self[self.ix]  # self.__getitem__(self.ix)
+            next_value = self.to_iter[self.ix]
             self.is_iterating = self.has_next()
             self.ix += self.step
             return next_value
@@ -177,13 +256,14 @@ class BasicRange(Iterable[Item]):
         """
         :return: bool, True if any items remain to iterate over; else False
         """
-        return self.not_yet_at(self.ix, self.end)
+        return self.ix < self.end if self.is_forward else self.ix > self.end
 
 
 class ErrIterChecker(BasicRange, IgnoreExceptions, KeepSkippingExceptions):
     def __init__(self, iter_over: Iterable, is_done: bool = False,
                  *catch: type[BaseException]):
-        BasicRange.__init__(self, list(iter_over))
+        BasicRange.__init__(self, iter_over if isinstance(
+            iter_over, Sequence) else list(iter_over))
         KeepSkippingExceptions.__init__(self, catch, is_done)
 
     def __enter__(self) -> Self:
@@ -197,11 +277,20 @@ class ErrIterChecker(BasicRange, IgnoreExceptions, KeepSkippingExceptions):
         """
         return self
 
+    def __iter__(self) -> Self:
+        """ Iterate with `__next__`, continuing from the current index and \
+            updating `is_iterating`, so `for` loops and polling agree.
+
+        :return: ErrIterChecker, self.
+        """
+        return self
+
     def __exit__(self, exc_type: type[BaseException] | None = None,
                  exc_val: BaseException | None = None, _: Any = None) -> bool:
         if exc_val:
             self.errors.append(exc_val)
-        return super().__exit__(exc_type)  # , exc_val, _)
+        # Same check as IgnoreExceptions.__exit__ without the super() call
+        return (not self.catch) or (exc_type in self.catch)
 
     def is_not_ready(self) -> bool:
         """ 
@@ -213,6 +302,7 @@ class ErrIterChecker(BasicRange, IgnoreExceptions, KeepSkippingExceptions):
 class ReadyChecker(BasicRange[Item]):
     """ Context manager class to conveniently check once per iteration \
         whether an item being modified is ready to return. """
+    __slots__ = ("_is_ready", "args", "item_is_ready", "kwargs", "to_check")
     _ReadyChecker = Callable[..., bool]
 
     def __init__(self, to_check: Any, iter_over: Iterable[Item],
@@ -220,21 +310,26 @@ class ReadyChecker(BasicRange[Item]):
                  **ready_kwargs: Any) -> None:
         """
         :param to_check: Any, the item to iteratively check the readiness of.
-        :param iter_over: Iterable to iterate over.
+        :param iter_over: Iterable to iterate over; used as-is without \
+            copying if it's already a Sequence
         :param ready_if: Callable[[Any, *ready_args, **ready_kwargs], bool], \
             function that returns either True if `to_check` is ready to \
             return or False if it needs further modification.
         :param ready_args: Iterable of positional arguments to pass \
             into the `ready_if` function
-        :param ready_args: Mapping[str, Any] of keyword arguments to pass \
-            into the `ready_if` function
+        :param ready_kwargs: Mapping[str, Any] of keyword arguments to \
+            pass into the `ready_if` function
         """
-        super().__init__(iter_over=list(iter_over))
+        super().__init__(iter_over=iter_over if isinstance(
+            iter_over, Sequence) else list(iter_over))
         self.args = ready_args
         self.item_is_ready = ready_if
         self.kwargs = ready_kwargs
         self.to_check = to_check
 
+        # Bind the extra arguments once instead of unpacking them per check
+        self._is_ready = _append_args(ready_if, ready_args, ready_kwargs)
+
     def __call__(self, item: Any) -> None:
         """ Save a thing to iteratively modify and check the readiness of.
 
@@ -253,6 +348,14 @@ class ReadyChecker(BasicRange[Item]):
         """
         return self
 
+    def __iter__(self) -> Self:
+        """ Iterate with `__next__`, continuing from the current index and \
+            updating `is_iterating`, so `for` loops and polling agree.
+
+        :return: ReadyChecker, self.
+        """
+        return self
+
     def __exit__(self, exc_type: type[BaseException] | None = None,
                  *_: Any) -> bool:
         """ Method called when exiting the active block of a context manager.
@@ -267,4 +370,4 @@ class ReadyChecker(BasicRange[Item]):
         """ 
         :return: bool, True to keep iterating; else False if that's unneeded.
         """
-        return self.is_iterating and not self.item_is_ready(self.to_check)
+        return self.is_iterating and not self._is_ready(self.to_check)
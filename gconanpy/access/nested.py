@@ -5,35 +5,33 @@ Classes to inspect/examine/unwrap complex/nested data structures.
 Extremely useful and convenient for debugging.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-01-23
-Updated: 2026-04-23
+Updated: 2026-10-18
 """
 # Import standard libraries
-from collections.abc import Callable, Iterable, Mapping
-from operator import getitem
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import chain
+from operator import attrgetter, getitem, itemgetter
 from typing import Any, cast, TypeVar
 
-# Import third-party PyPI libraries
-from more_itertools import all_equal
-
 # Import local custom libraries
 try:
     from gconanpy.debug import Debuggable
     from gconanpy.iters import SimpleShredder, uniqs_in
     from gconanpy.iters.filters import MapSubset
-    from gconanpy.meta import Comparer, has_method, \
-        IgnoreExceptions, IteratorFactory, name_of
+    from gconanpy.meta import cached_property, Comparer, IgnoreExceptions, \
+        IteratorFactory, name_of, TypeHasMethod
     from gconanpy.meta.typeshed import DATA_ERRORS
     from gconanpy.strings import stringify, stringify_iter
-    from gconanpy.trivial import get_key_set
+    from gconanpy.trivial import always_true, get_key_set
     from gconanpy.wrappers import Sets
 except (ImportError, ModuleNotFoundError):  # TODO DRY?
     from ..debug import Debuggable
     from ..iters import SimpleShredder, uniqs_in
     from ..iters.filters import MapSubset
-    from ..meta import Comparer, has_method, \
-        IgnoreExceptions, IteratorFactory, name_of
+    from ..meta import cached_property, Comparer, IgnoreExceptions, \
+        IteratorFactory, name_of, TypeHasMethod
     from ..meta.typeshed import DATA_ERRORS
-    from ..trivial import get_key_set
+    from ..trivial import always_true, get_key_set
     from ..strings import stringify, stringify_iter
     from ..wrappers import Sets
 
@@ -43,6 +41,10 @@ class DifferenceBetween:
     _Comparable = TypeVar("_Comparable")
     _Diff = TypeVar("_Diff")
 
+    # Class variable: how to list names and diffs in __repr__
+    _STRINGIFY_KWARGS: dict[str, Any] = dict(
+        quote=None, prefix=None, suffix=None)
+
     # Instance variables
     comparables: list  # The objects to compare/contrast
     difference: str | None  # Name classifying the difference
@@ -63,21 +65,26 @@ class DifferenceBetween:
         for name, to_compare in kwargs.items():
             self.names.append(name)
             self.comparables.append(to_compare)
+
+        # Track used names & per-type counts to name each unnamed arg in O(1)
+        used = set(self.names)
+        type_counts: dict[str, int] = dict()
         for arg in args:
             self.comparables.append(arg)
 
             # By default, name unnamed objects their type and insertion order
             arg_type = name_of(arg)
-            i = 1  # TODO try to make a do-while context manager "with-hack"?
-            arg_name = f"{arg_type}{i}"
-            while arg_name in self.names:
+            i = type_counts.get(arg_type, 0) + 1
+            while f"{arg_type}{i}" in used:
                 i += 1
-                arg_name = f"{arg_type}{i}"
+            type_counts[arg_type] = i
+            arg_name = f"{arg_type}{i}"
+            used.add(arg_name)
             self.names.append(arg_name)
 
         # If objects differ, then discover how; else there's no need
         try:
-            self.is_different = not all_equal(self.comparables)
+            self.is_different = not self._are_all_same(self.comparables)
             self.diffs = self.find() if self.is_different else []
         except DATA_ERRORS:
             self.diffs = self.find()
@@ -87,21 +94,41 @@ class DifferenceBetween:
         """ :return: bool, True if self.comparables differ; else False """
         return self.is_different
 
+    @staticmethod
+    def _are_all_same(objects: list) -> bool:
+        """ 
+        :param objects: list of objects to compare to the first one
+        :return: bool, True if every object is or equals the first; else \
+            False as soon as any object is found to differ from the first
+        """
+        if objects:
+            first = objects[0]
+            for i in range(1, len(objects)):
+                if objects[i] is not first and not objects[i] == first:
+                    return False
+        return True
+
     def __repr__(self) -> str:
         """
+        :return: str, human-readable summary of how self.comparables differ.
+        """
+        return self.summary
+
+    @cached_property[str]
+    def summary(self) -> str:
+        """ Only build the summary once, because a DifferenceBetween's \
+            comparables and differences don't change after __init__.
+
         :return: str, human-readable summary of how self.comparables differ.
         """
         if not self.is_different:
             result = " == ".join(self.names)
         else:
-            kwargs_stringify: dict[str, Any] = dict(
-                quote=None, prefix=None, suffix=None)
-            names = stringify_iter(self.names, **kwargs_stringify)
+            names = stringify_iter(self.names, **self._STRINGIFY_KWARGS)
             if self.difference:
-                diffs_list = [
-                    f"{self.difference} of {self.names[i]} is {self.diffs[i]}"
-                    for i in range(len(self.diffs))]
-                diffs_str = stringify_iter(diffs_list, **kwargs_stringify
+                diffs_list = [f"{self.difference} of {name} is {diff}"
+                              for name, diff in zip(self.names, self.diffs)]
+                diffs_str = stringify_iter(diffs_list, **self._STRINGIFY_KWARGS
                                            ).capitalize()
                 result = f"{self.difference.capitalize()} differs between " \
                     f"{names}:\n{diffs_str}"
@@ -128,11 +155,19 @@ class DifferenceBetween:
             if any was found
         """
         diffs = []
+        prefix = by + " "
         for next_name in comparisons:
             if self.difference:
                 break
-            diffs = self.compare_by(f"{by} {next_name}", lambda y:
-                                    get_subcomparator(y, next_name))
+            # Use faster C equivalents of getitem and getattr when possible
+            if get_subcomparator is getitem:
+                get_comparator = itemgetter(next_name)
+            elif get_subcomparator is getattr:
+                get_comparator = attrgetter(next_name)
+            else:
+                get_comparator = lambda y, name=next_name: \
+                    get_subcomparator(y, name)
+            diffs = self.compare_by(prefix + str(next_name), get_comparator)
         return diffs
 
     def compare_by(self, by: str, get_comparator: Callable[[Any], _Diff]
@@ -145,17 +180,55 @@ class DifferenceBetween:
             aspect from each thing being compared
         :return: list, the comparable aspects of each thing being compared
         """
-        comparables = [get_comparator(c) for c in self.comparables]
-        try:
-            if not all_equal(comparables):
-                self.difference = by
-        except DATA_ERRORS:  # Recursively dissect non-Boolables
+        # Compare each aspect to the first while collecting them, so that
+        # they're only iterated once and comparison stops at the 1st mismatch
+        comparables = list()
+        differs = unboolable = False
+        for each_comparable in self.comparables:
+            aspect = get_comparator(each_comparable)
+            if not comparables:
+                first = aspect
+            elif not differs:
+                try:
+                    differs = aspect is not first and not aspect == first
+                except DATA_ERRORS:
+                    differs = unboolable = True
+            comparables.append(aspect)
+
+        if unboolable:  # Recursively dissect non-Boolables
             subdiff = type(self)(*comparables)
             if subdiff.difference:
                 comparables = subdiff.diffs
                 self.difference = f"{subdiff.difference} of {by}"
+        elif differs:
+            self.difference = by
         return comparables
 
+    def compare_sets(self, keys_by: str, values_by: str,
+                     get_keys: Callable[[Any], Iterable[_Comparable]],
+                     get_subcomparator: Callable[[Any, _Comparable], _Diff]
+                     ) -> list:
+        """ Compare the objects' keys (or other names of aspects that may \
+            differ); if they're the same, then compare each key's values.
+
+        :param keys_by: str, name of the difference if the keys differ
+        :param values_by: str, name of the difference if a key's values differ
+        :param get_keys: Callable[[ToCompare: Any], Iterable[AspectName]], \
+            function that returns the keys of each object, e.g. `dir`
+        :param get_subcomparator: Callable[[ToCompare: Any, AspectName: \
+            Hashable], _Diff: Any], function that accepts 2 arguments (the \
+            object to compare to others and its comparable aspect's name) \
+            and returns the named comparable aspect from each object
+        :return: list, each object's unique keys if the keys differ; else \
+            each object's value for the first key whose values differ, if any
+        """
+        # Get each object's keys only once, then reuse them to get its values
+        keys = self.compare_by(keys_by, get_keys)
+        if self.difference:
+            return list(Sets(keys).differentiate())
+        return self.compare_every(values_by, get_subcomparator, keys[0]) \
+            if keys else list()
+
     def find(self) -> list:
         """ Find the difference(s) between the objects in self.comparables.
             Returns the first difference found, not an exhaustive list.
@@ -168,40 +241,40 @@ class DifferenceBetween:
         if self.difference:
             return types
 
-        with IgnoreExceptions(TypeError):
+        try:
             # If the objects' lengths differ, return a list of their lengths
             lens = self.compare_by("length", len)
             if self.difference:
                 return lens
 
-            with IgnoreExceptions(AttributeError, TypeError):
-                # If the objects' keys differ, return each one's unique key(s)
-                keys = self.compare_by("key", get_key_set)
+            try:
+                # If the objects' keys differ, return each one's unique key(s);
+                # if their values differ for a certain key, return each one's
+                # value for that key
+                keys_or_values = self.compare_sets("key", "value",
+                                                   get_key_set, getitem)
                 if self.difference:
-                    return list(Sets(keys).differentiate())
-                else:
+                    return keys_or_values
+            except (AttributeError, TypeError):
+                pass
 
-                    # If the objects' values differ for a certain key, return
-                    # each one's value for that key
-                    values = self.compare_every("value", getitem, keys)
-                    if self.difference:
-                        return values
-
-            with IgnoreExceptions(KeyError):
+            try:
                 # If the objects' elements differ at a certain index, return
                 # each one's element at that index
-                ix_diffs: list[int] = self.compare_every("element", getitem, [
-                    x for x in range(set(lens).pop())])
+                ix_diffs: list[int] = self.compare_every(
+                    "element", getitem, range(lens[0]))
                 if self.difference:
                     return ix_diffs
-
-        # If the objects have a different value for a certain attribute,
-        # return each one's value for that attribute
+            except KeyError:
+                pass
+        except TypeError:
+            pass
+
+        # If the objects have different attributes, then return each one's
+        # unique attribute(s); if they have a different value for a certain
+        # attribute, then return each one's value for that attribute
         BY = "unique attribute(s)"
-        keys = self.compare_by(BY, dir)
-        diff_attrs = list[set[str]](Sets[str](keys).differentiate()) if \
-            self.difference else self.compare_every(
-                BY, getattr, next(iter(keys)))
+        diff_attrs = self.compare_sets(BY, BY, dir, getattr)
 
         # Finally, if no difference was found, return an empty list
         return diff_attrs if self.difference else []
@@ -209,6 +282,7 @@ class DifferenceBetween:
 
 class Peeler(IteratorFactory):
     _P = TypeVar("_P")  # Item(s) to extract from a "peeled" container.
+    HAS_STRIP = TypeHasMethod("strip")  # Whether each type is string-like
 
     @classmethod
     def can_peel(cls, an_obj: Any) -> bool:
@@ -217,7 +291,8 @@ class Peeler(IteratorFactory):
         :return: bool, True if an_obj is a container of 1 element; else False
         """
         try:
-            is_peelable = len(an_obj) == 1 and not has_method(an_obj, "strip")
+            is_peelable = len(an_obj) == 1 and \
+                not cls.HAS_STRIP[type(an_obj)]
         except DATA_ERRORS:
             is_peelable = False
         return is_peelable
@@ -230,13 +305,21 @@ class Peeler(IteratorFactory):
             Iterables; this will be an Iterable unless to_peel contains only \
             one item, in which case the function will return that item
         """
-        while self.can_peel(to_peel):
-            to_peel = self.first_element_of(to_peel)
-        return to_peel
+        # Inline can_peel and first_element_of to skip 2 calls per layer
+        has_strip = self.HAS_STRIP
+        iterate = self.iterate
+        while True:
+            try:
+                if len(to_peel) != 1 or has_strip[type(to_peel)]:
+                    return to_peel
+            except DATA_ERRORS:
+                return to_peel
+            to_peel = next(iterate(to_peel))
 
 
 class Shredder(SimpleShredder, Debuggable):
     _T = TypeVar("_T")
+    HAS_ITEMS = TypeHasMethod("items")  # Whether each type is Mapping-like
 
     def __init__(self, max_shreds: int = 500, debugging: bool = False,
                  map_filter: MapSubset.FilterFunction | None = None) -> None:
@@ -254,32 +337,41 @@ class Shredder(SimpleShredder, Debuggable):
         self.max_shreds = max_shreds
         self.reset()
 
-    def _shred_iterable(self, an_obj: Iterable) -> None:
-        """ Save every item in an Iterable regardless of how deeply nested, \
-            unless that item is "shreddable" (a non-string data container) \
-            or that item is excluded by the filters defined in __init__
+    def _shred_iterable(self, an_obj: Iterable, to_shred: list[Iterator]
+                        ) -> None:
+        """ Queue every item in an Iterable to be shredded, unless this \
+            shredder already traversed that Iterable, already traversed \
+            `max_shreds` Iterables, or that item is excluded by the filters \
+            defined in __init__
 
         :param an_obj: Iterable to save the "shreddable" elements of.
+        :param to_shred: list[Iterator], stack of iterators over the items \
+            of each container that is currently being shredded.
         """
-        # If we already shredded it, then don't shred it again
-        if self._will_now_traverse(an_obj) and len(self.traversed
-                                                   ) < self.max_shreds:
+        # Stop at the shred limit, and don't shred anything twice
+        if len(self.traversed) < self.max_shreds and \
+                self._will_now_traverse(an_obj) and \
+                not self._save_leaves(an_obj):
+
+            # Shred or save each of an_obj's values if it's a Mapping, unless
+            # filtered out, else its elements; check its type instead of
+            # raising & catching
+            map_filter = self.filter
+            has_items = self.HAS_ITEMS
+            if map_filter is None or map_filter is always_true:
+                contents = iter(cast(Mapping, an_obj).values()) \
+                    if self.HAS_VALUES[type(an_obj)] else iter(an_obj)
+            elif has_items[type(an_obj)]:
+                contents = (v for k, v in cast(Mapping, an_obj).items()
+                            if has_items[type(v)] or map_filter(k, v))
+            else:
+                contents = iter(an_obj)
 
-            # If it has a __dict__, then shred that
+            # If it has a __dict__, then shred that first
             with IgnoreExceptions(*self.SHRED_ERRORS):
-                self._shred_iterable(an_obj.__dict__)
-
-            # Shred or save each of an_obj's...
-            try:  # ...values if it's a Mapping
-                for k, v in cast(Mapping, an_obj).items():
-                    if has_method(v, "items") or self.filter is None \
-                            or self.filter(k, v):
-                        self.shred(v)
-            except self.SHRED_ERRORS:
+                contents = chain((an_obj.__dict__, ), contents)
 
-                # ...elements if it's not a Mapping
-                for element in an_obj:
-                    self.shred(element)
+            to_shred.append(contents)
 
 
 class Corer(Shredder, Comparer):
@@ -364,7 +456,7 @@ class Corer(Shredder, Comparer):
         """
         if reset_first:
             self.reset()
-        parts = {p for p in self.shred(to_core) if isinstance(p, as_type)}
+        parts = set(filter(as_type.__instancecheck__, self.shred(to_core)))
         cored = self._choose(parts, default, compare_their, make_comparable)
         if cored is None:
             raise ValueError(f"Failed to core {name_of(to_core)}")
@@ -375,6 +467,16 @@ class Xray(list):
     """Given any object, easily check what kinds of things it contains.
     Extremely convenient for interactive debugging."""
 
+    # Functions to list each detail of an object, in the order to try them
+    PROBES: dict[str, Callable[[Any], list]] = {
+        "contents": lambda an_obj: [x for x in an_obj],
+        "outputs": lambda an_obj: [x for x in an_obj()],
+        "attributes": dir}
+
+    # Other valid `list_its` values mapped to the PROBES key they mean
+    ALIASES = {"elements": "contents", "results": "outputs",
+               "properties": "attributes"}
+
     def __init__(self, an_obj: Any, list_its: str | None = None) -> None:
         """ Given any object, easily check what kinds of things it contains.
 
@@ -385,30 +487,23 @@ class Xray(list):
             list_its="properties" names the attributes of an_obj.\
             list_its=None (by default) will try all 3 in that order.
         """
-        to_check = iter(("contents", "outputs", "attributes"))
-        what_elements_are = list_its
-        gotten = None
-        while gotten is None:
-            try:  # Figure out what details of an_obj to list
-                match what_elements_are:
-                    case "contents" | "elements":
-                        gotten = [x for x in an_obj]
-                    case "outputs" | "results":
-                        gotten = [x for x in an_obj()]
-                    case "attributes" | "properties":
-                        gotten = dir(an_obj)
-                    case _:
-                        what_elements_are = next(to_check)
-            except (NameError, TypeError) as err:
-                if list_its:  # Crash if we cannot get what was asked for
-                    raise err
-                else:  # Keep looking for useful info to return
-                    what_elements_are = next(to_check)
-
-        if not list_its:
-            list_its = what_elements_are
-        self.what_elements_are = name_of(an_obj) + \
-            f" {list_its if list_its else what_elements_are}"
+        if list_its:  # Crash if we cannot get what was asked for
+            what_elements_are = self.ALIASES.get(list_its, list_its)
+
+            # List an_obj's contents if list_its names no other detail
+            probe = self.PROBES.get(what_elements_are, self.PROBES["contents"])
+            gotten = probe(an_obj)
+        else:  # Figure out what details of an_obj to list
+            for what_elements_are, probe in self.PROBES.items():
+                try:
+                    gotten = probe(an_obj)
+                    break
+                except (NameError, TypeError):
+                    pass  # Keep looking for useful info to return
+
+        # Save what to describe in what_elements_are only if it's needed
+        self._xrayed = an_obj
+        self._list_its = list_its if list_its else what_elements_are
 
         with IgnoreExceptions(TypeError):
             gotten = uniqs_in(gotten, stringify)
@@ -416,3 +511,8 @@ class Xray(list):
 
     def __repr__(self):
         return f"{self.what_elements_are}: {stringify_iter(self)}"
+
+    @cached_property[str]
+    def what_elements_are(self) -> str:
+        """ :return: str, the name of the object listed & what was listed """
+        return name_of(self._xrayed) + " " + self._list_its
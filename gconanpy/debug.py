@@ -6,7 +6,7 @@ Overlaps significantly with audit-ABCC/src/utilities.py and \
     abcd-bids-tfmri-pipeline/src/pipeline_utilities.py
 Greg Conan: gregmconan@gmail.com
 Created: 2025-01-23
-Updated: 2026-03-05
+Updated: 2026-10-18
 """
 # Import standard libraries
 from abc import ABC
@@ -17,7 +17,6 @@ import graphlib
 from io import TextIOWrapper
 import logging
 import os
-import pdb
 import sys
 from time import perf_counter_ns
 import traceback
@@ -66,7 +65,7 @@ def debug(an_err: Exception, local_vars: Mapping[str, Any]) -> None:
     except Exception as new_err:
         errs.append(new_err)
     # show_keys_in(locals(), level=logger.level)
-    pdb.set_trace()
+    breakpoint()
     pass
 
 
@@ -344,7 +343,7 @@ def take_snapshot(logger: logging.Logger, how: str = "lineno"
         "Object": snap} for snap in snap_stats])
     total_size = HumanBytes.format(int(snap_df['Size'].sum()), precision=2)
     logger.info(f"Total Memory Usage: {total_size}")
-    pdb.set_trace()
+    breakpoint()
     return snapshot
 
 
@@ -3,18 +3,21 @@
 """
 Greg Conan: gregmconan@gmail.com
 Created: 2025-04-21
-Updated: 2026-03-09
+Updated: 2026-10-18
 """
 # Import standard libraries
 import abc
 from collections.abc import \
     Callable, Container, Generator, Iterable, Iterator, Mapping
+import functools
 import graphlib
 import inspect
+from operator import attrgetter
 import re
 import sys
-from types import ModuleType
-from typing import Any, cast
+from types import MemberDescriptorType, ModuleType
+from typing import Any
+from weakref import WeakKeyDictionary
 
 # Import third-party PyPI libraries
 from makefun import create_function, with_signature
@@ -22,14 +25,12 @@ from makefun import create_function, with_signature
 # Import local custom libraries
 try:
     from gconanpy.access import attributes
-    from gconanpy.iters import merge
     from gconanpy.iters.filters import MapSubset
     from gconanpy.meta import name_of
     from gconanpy.meta.typeshed import HasSlots
     from gconanpy.strings import FancyString
 except (ImportError, ModuleNotFoundError):  # TODO DRY?
     from .access import attributes
-    from .iters import merge
     from .iters.filters import MapSubset
     from .meta import name_of
     from .meta.typeshed import HasSlots
@@ -39,15 +40,32 @@ except (ImportError, ModuleNotFoundError):  # TODO DRY?
 # Function wrapper type variable  # TODO DRY (can't import it from metafunc?)
 Wrapper = Callable[[Callable], Callable]
 
+# Each with_signature parameter that signature_extends fills in by default,
+# and the attribute of the extended function to fill it in with
+WRAPPED_ATTRIBUTES = (("doc", "__doc__"), ("qualname", "__qualname__"),
+                      ("func_name", "__name__"), ("module_name", "__module__"))
 
+# Signatures already found by signature_of, without keeping functions alive
+SIGNATURES: WeakKeyDictionary[Callable, inspect.Signature] = \
+    WeakKeyDictionary()
+
+
+@functools.cache  # A class's MRO can't change, so only merge it once
 def all_annotations_of(a_class: type) -> dict[str, type]:
     """ 
     :param a_class: type
     :return: dict[str, type], the `__annotations__` of `a_class` and all of \
-        its parent (`__mro__`) classes, prioritizing `a_class`'s annotations
+        its parent (`__mro__`) classes, prioritizing `a_class`'s annotations. \
+        The same `dict` is returned for every call on `a_class`, so don't \
+        modify it.
     """
-    return merge([cast(dict, getattr(base, "__annotations__", {}))
-                  for base in reversed(a_class.__mro__)])
+    annotations = dict()
+    for base in reversed(a_class.__mro__):
+        # Only check each class's own annotations, not any it would inherit
+        base_annotations = base.__dict__.get("__annotations__")
+        if base_annotations:
+            annotations.update(base_annotations)
+    return annotations
 
 
 def all_type_classes() -> dict[str, type | abc.ABCMeta]:
@@ -73,9 +91,11 @@ def classes_in_module(module: ModuleType) -> Generator[tuple[str, type],
     """
     module_name = name_of(module)
 
-    def is_class_from_module(an_obj: Any) -> bool:
-        return inspect.isclass(an_obj) and an_obj.__module__ == module_name
-    yield from inspect.getmembers(module, is_class_from_module)
+    # Sorted by name like inspect.getmembers, but without calling getattr
+    # on every name that dir(module) lists
+    yield from sorted((name, value) for name, value in vars(module).items()
+                      if isinstance(value, type)
+                      and value.__module__ == module_name)
 
 
 def combine(name: str, classes: Iterable[type], **kwargs: Any) -> type:
@@ -93,7 +113,7 @@ def extend(a_class: type, name: str, wrappers: Mapping[str, Wrapper],
            **new: Any) -> type:
     wrapped = {meth_name: wrappers[meth_name](meth)
                if meth_name in wrappers else meth
-               for meth_name, meth in attributes.AttrsOf(a_class).methods()}
+               for meth_name, meth in methods_of(a_class)}
     return type(name, tuple(), {**wrapped, **new})
 
 
@@ -107,11 +127,54 @@ def initialize(self: HasSlots, *args: Any, **kwargs: Any) -> None:
 
     :param self: HasSlots, object with a `__slots__: tuple[str, ...]` attribute \
         naming the `__init__` input arguments.
+    :raises TypeError: if there are more `args` than `self.__slots__`
     """
+    if len(args) > len(self.__slots__):
+        raise TypeError(f"{name_of(self)} takes {len(self.__slots__)} "
+                        f"positional arguments but {len(args)} were given")
     kwargs.pop("__slots__", None)
-    for i in range(len(args)):
-        kwargs[self.__slots__[i]] = args[i]
-    attributes.add_to(self, **kwargs)
+    for name, value in kwargs.items():
+        setattr(self, name, value)
+    for name, value in zip(self.__slots__, args):  # args override kwargs
+        setattr(self, name, value)
+
+
+def initializer_for(init_sig: inspect.Signature) -> Callable | None:
+    """ Generate an `__init__` method for `weak_dataclass` that assigns \
+        each input argument straight to its attribute, one line per argument.
+
+    :param init_sig: inspect.Signature of the `__init__` method to generate; \
+        its first parameter must be a positional-only `self` parameter.
+    :return: Callable, the generated `__init__` method; or None if `init_sig` \
+        has variadic (`*args` or `**kwargs`) parameters, which `initialize` \
+        can handle but this simpler generated method cannot.
+    """
+    KEY_ONLY = inspect.Parameter.KEYWORD_ONLY
+    POS_OR_KEY = inspect.Parameter.POSITIONAL_OR_KEYWORD
+    arg_strs = ["self", "/"]
+    lines = list()
+    # Namespace of default values for generated function, which belongs to
+    # this module like the initialize function that it replaces
+    defaults: dict[str, Any] = {"__name__": __name__}
+    for param in [*init_sig.parameters.values()][1:]:
+        if param.kind is KEY_ONLY:
+            if "*" not in arg_strs:
+                arg_strs.append("*")
+        elif param.kind is not POS_OR_KEY:
+            return None
+        arg_str = param.name
+        if param.default is not param.empty:
+            default_name = f"_{param.name}_default"
+            defaults[default_name] = param.default
+            arg_str += "=" + default_name
+        arg_strs.append(arg_str)
+        if param.name != "__slots__":
+            lines.append(f"self.{param.name} = {param.name}")
+    exec(f"def __init__({', '.join(arg_strs)}):\n    " +
+         "\n    ".join(lines or ["pass"]), defaults)
+    init = defaults["__init__"]
+    init.__signature__ = init_sig
+    return init
 
 
 def make_MRO_for_subclass_of(*types: type) -> Iterator[type]:
@@ -123,9 +186,9 @@ def make_MRO_for_subclass_of(*types: type) -> Iterator[type]:
     dag_dict = {}
     for each_class in types:
         # Exclude self (`each_class`) and object class (`object`) from MRO
-        dag_dict[each_class] = inspect.getmro(each_class)[1:-1]
+        dag_dict[each_class] = each_class.__mro__[1:-1]
     rev_mro = graphlib.TopologicalSorter(dag_dict).static_order()
-    return reversed([each_class for each_class in rev_mro])
+    return reversed(tuple(rev_mro))
 
 
 def module_classes_to_args_dict(module: ModuleType, *suffixes: str,
@@ -133,25 +196,55 @@ def module_classes_to_args_dict(module: ModuleType, *suffixes: str,
                                 ) -> dict[str, type]:
     classes = {}
     for class_name, each_class in classes_in_module(module):
-        for suffix in suffixes:
-            if class_name.endswith(suffix) and each_class not in ignore:
-                classes[class_name.removesuffix(suffix).lower()] = each_class
-                break
+        # Check every suffix in 1 call; only find which one if any matched
+        if class_name.endswith(suffixes) and each_class not in ignore:
+            for suffix in suffixes:
+                if class_name.endswith(suffix):
+                    classes[class_name.removesuffix(suffix).lower()] = \
+                        each_class
+                    break
     return classes
 
 
-def params_for(a_class: type, *args: inspect.Parameter
-               ) -> list[inspect.Parameter]:
+@functools.cache  # Only build each class's annotated parameters once
+def annotated_params_of(a_class: type) -> tuple[
+        tuple[inspect.Parameter, ...], tuple[inspect.Parameter, ...]]:
+    """ 
+    :param a_class: type
+    :return: tuple of 2 tuple[inspect.Parameter, ...]s, `self` and the \
+        parameters without default values, then the parameters with default \
+        values, for each of `a_class`'s annotated attributes
+    """
+    EMPTY = inspect.Parameter.empty
     POS_OR_KEY = inspect.Parameter.POSITIONAL_OR_KEYWORD
     params = [self_param(self_is=a_class)]
     withdefaults: list[inspect.Parameter] = []
     for name, annotation in all_annotations_of(a_class).items():
-        pkwargs = dict(name=name, annotation=annotation, kind=POS_OR_KEY)
-        if hasattr(a_class, name):
-            pkwargs["default"] = getattr(a_class, name)
-            withdefaults.append(inspect.Parameter(**pkwargs))  # type: ignore
+        default = getattr(a_class, name, EMPTY)  # Inherited defaults count
+        if isinstance(default, MemberDescriptorType):
+            default = unslotted_default_of(a_class, name)
+        param = inspect.Parameter(name, POS_OR_KEY, default=default,
+                                  annotation=annotation)
+        if default is EMPTY:
+            params.append(param)
         else:
-            params.append(inspect.Parameter(**pkwargs))  # type: ignore
+            withdefaults.append(param)
+    return tuple(params), tuple(withdefaults)
+
+
+@functools.cache  # Only list each class's methods once
+def methods_of(a_class: type) -> tuple[tuple[str, Callable], ...]:
+    """
+    :param a_class: type
+    :return: tuple[tuple[str, Callable], ...], the name and value of each \
+        method of `a_class` when this function was first called on it
+    """
+    return tuple(attributes.AttrsOf(a_class).methods())
+
+
+def params_for(a_class: type, *args: inspect.Parameter
+               ) -> list[inspect.Parameter]:
+    params, withdefaults = map(list, annotated_params_of(a_class))
     for arg in args:
         if arg.default is arg.empty:
             params.append(arg)
@@ -176,17 +269,38 @@ def trim_MRO(classes: Iterable[type]) -> tuple[type]:
         to use as 2nd parameter to dynamically define a class using type(...)
     """
     minimal_MRO = []
+    inherited = set()  # Every class that a class in minimal_MRO inherits
     for each_class in classes:
-        is_redundant = False
-        for needed_class in minimal_MRO:
-            if issubclass(needed_class, each_class):
-                is_redundant = True
-                break
-        if not is_redundant:
-            minimal_MRO.append(each_class)
+        # Skip each_class if a class already in minimal_MRO inherits from it
+        if each_class in inherited:
+            continue
+
+        # ABCs can have "virtual" subclasses that aren't in their __mro__
+        if isinstance(each_class, abc.ABCMeta) and any(
+                issubclass(needed_class, each_class)
+                for needed_class in minimal_MRO):
+            continue
+
+        minimal_MRO.append(each_class)
+        inherited.update(each_class.__mro__)
     return tuple(minimal_MRO)  # type(...) 2nd parameter must be a tuple
 
 
+def signature_of(func: Callable) -> inspect.Signature:
+    """ Only inspect each function's signature once, if it can be cached.
+
+    :param func: Callable, function or method to inspect
+    :return: inspect.Signature, the input parameters of `func`
+    """
+    try:
+        return SIGNATURES[func]
+    except KeyError:
+        signature = SIGNATURES[func] = inspect.signature(func)
+        return signature
+    except TypeError:  # func is unhashable or can't be weakly referenced
+        return inspect.signature(func)
+
+
 def signature_extends(func: Callable,
                       pre: Iterable[inspect.Parameter] = [],
                       post: Iterable[inspect.Parameter] = [],
@@ -201,11 +315,11 @@ def signature_extends(func: Callable,
     :return: Callable[[Callable], Callable], Wrapper, function decorator to \
         add the specified input arguments to a given method/function `func`
     """
-    for param, attr in dict(doc="doc", qualname="qualname", func_name="name",
-                            module_name="module").items():
-        kwargs.setdefault(param, getattr(func, f"__{attr}__", default))
+    for param, attr in WRAPPED_ATTRIBUTES:
+        if param not in kwargs:  # Only get the attribute if it's needed
+            kwargs[param] = getattr(func, attr, default)
 
-    old_params = inspect.signature(func).parameters
+    old_params = signature_of(func).parameters
     new_sig = inspect.Signature(parameters=[*pre, *old_params.values(), *post])
 
     return with_signature(new_sig, **kwargs)
@@ -239,30 +353,92 @@ RegexSearcher = extend1(re.Match, "RegexSearcher", append_default,
 
 
 class WeakDataclassBase:
-    __slots__: tuple
+    __slots__: tuple = ()  # Don't give WeakDataclass instances a __dict__
+    # _get_slots is set by weak_dataclass; not annotated to keep it unslotted
 
     def __repr__(self) -> str:
-        return FancyString.fromCallable(type(self), **{
-            x: getattr(self, x) for x in self.__slots__}, max_len=100)
+        return FancyString.fromCallable(type(self), **dict(zip(
+            self.__slots__, type(self)._get_slots(self))),  # type: ignore
+            max_len=100)
 
     def __eq__(self, other) -> bool:
-        my_slots = self.__slots__
-        if my_slots != other.__slots__:
-            return False
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        get_slots = type(self)._get_slots  # type: ignore
+        return get_slots(self) == get_slots(other)
 
-        for slot in my_slots:
-            if getattr(self, slot) != getattr(other, slot):
-                return False
-        return True
+
+def slot_getter_for(slots: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """
+    :param slots: tuple[str, ...], names of attributes to get
+    :return: Callable[[Any], tuple], function that gets the values of all \
+        of the `slots` attributes of an object as a tuple in 1 call
+    """
+    match len(slots):
+        case 0:
+            return lambda _: ()
+        case 1:  # attrgetter returns a lone value, not a tuple, for 1 name
+            return lambda an_obj, name=slots[0]: (getattr(an_obj, name), )
+        case _:
+            return attrgetter(*slots)
+
+
+def unslotted_default_of(a_class: type, name: str) -> Any:
+    """ Find a class attribute's default value even if a parent `__slots__` \
+        (e.g. of a `weak_dataclass`) replaced it with a member descriptor.
+
+    :param a_class: type
+    :param name: str naming an attribute of `a_class`
+    :return: Any, the first non-slot value of `name` in `a_class.__mro__`; \
+        else `inspect.Parameter.empty` if there is none
+    """
+    EMPTY = inspect.Parameter.empty
+    for base in a_class.__mro__:
+        default = base.__dict__.get(name, EMPTY)
+        if default is not EMPTY and \
+                not isinstance(default, MemberDescriptorType):
+            return default
+    return EMPTY
 
 
 def weak_dataclass(a_class: type, *args: inspect.Parameter) -> type:
+    """ Simpler, faster alternative to `dataclasses.dataclass`. If \
+        `a_class` defines `__slots__` (e.g. `__slots__ = ()`), then the \
+        returned class stores each field in a slot, so its instances don't \
+        get a `__dict__`; else its fields stay in each instance's \
+        `__dict__` and its class-level defaults stay readable.
+
+    :param a_class: type, class whose annotated attributes are its fields
+    :param args: Iterable[inspect.Parameter], more `__init__` parameters
+    :return: type, subclass of `a_class` with an `__init__` method that \
+        takes a parameter for each field, and `__eq__` & `__repr__` methods
+    """
     all_params = params_for(a_class, *args)
     init_sig = inspect.Signature(all_params, return_annotation=None)
-    WeakDataclass = type(name_of(a_class), (a_class, WeakDataclassBase), {})
-    WeakDataclass.__slots__ = tuple([p.name for p in all_params[1:]
-                                     if p.name != "__slots__"])
-    WeakDataclass.__init__ = create_function(init_sig, initialize,
-                                             func_name="__init__",
-                                             qualname="__init__")
+    fields = tuple([p.name for p in all_params[1:] if p.name != "__slots__"])
+
+    # Only add slots if a_class opted into them, because a slot hides any
+    # class-level default value of the same name (e.g. Person.age)
+    bases = (a_class, WeakDataclassBase)
+    class_dict = dict()
+    if "__slots__" in a_class.__dict__:
+        # Store each field in a slot unless a parent class already has it
+        class_dict["__slots__"] = tuple(
+            name for name in fields if not isinstance(
+                getattr(a_class, name, None), MemberDescriptorType))
+    try:
+        WeakDataclass = type(name_of(a_class), bases, class_dict)
+    except TypeError:  # Some builtin types (e.g. int) can't add slots
+        WeakDataclass = type(name_of(a_class), bases, {})
+
+    # __slots__ names every field, not just the slots that this class added
+    WeakDataclass.__slots__ = fields
+    WeakDataclass._get_slots = slot_getter_for(WeakDataclass.__slots__)
+    WeakDataclass.__init__ = initializer_for(init_sig) or \
+        create_function(init_sig, initialize, func_name="__init__",
+                        qualname="__init__")
+    WeakDataclass.__init__.__qualname__ = \
+        f"{WeakDataclass.__qualname__}.__init__"
     return WeakDataclass
@@ -5,7 +5,7 @@ Useful/convenient lower-level utility functions and classes primarily to \
     access, create, and manipulate Iterables.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-07-28
-Updated: 2026-05-01
+Updated: 2026-10-18
 """
 # Import standard libraries
 import abc
@@ -24,11 +24,13 @@ from more_itertools import all_equal
 # Import local custom libraries
 try:
     from gconanpy.iters.filters import MapSubset
-    from gconanpy.meta import divmod_base, method, Traversible, tuplify
+    from gconanpy.meta import divmod_base, method, Traversible, \
+        tuplify, TypeHasMethod
     from gconanpy.meta.typeshed import Poppable, Updatable
 except (ImportError, ModuleNotFoundError):  # TODO DRY?
     from .filters import MapSubset
-    from ..meta import divmod_base, method, Traversible, tuplify
+    from ..meta import divmod_base, method, Traversible, \
+        tuplify, TypeHasMethod
     from ..meta.typeshed import Poppable, Updatable
 
 # TypeVars to define type hints for...
@@ -229,7 +231,15 @@ def merge(updatables: Iterable[_U]) -> _U:
     :param updatables: Iterable[Updatable], objects to combine
     :return: Updatable combining all of the `updatables` into one
     """
-    return functools.reduce(update_return, updatables)
+    # Call each `update` method directly instead of through update_return
+    to_merge = iter(updatables)
+    try:
+        merged = next(to_merge)
+    except StopIteration:
+        raise TypeError("merge() of empty iterable") from None
+    for updatable in to_merge:
+        merged.update(updatable)
+    return merged
 
 
 def powers_of_ten(orders_of_magnitude: int = 4) -> list[int]:
@@ -333,7 +343,8 @@ def uniqs_in(listlike: Iterable[_H], stringify: Callable[[Any], str] = str
     :return: list[Hashable] (sorted) of all unique strings in listlike \
              that don't start with an underscore
     """
-    uniqs = [*set([v for v in listlike if not startswith(v, "_", stringify)])]
+    # Deduplicate (in C) before filtering, to only check each value once
+    uniqs = [v for v in set(listlike) if not startswith(v, "_", stringify)]
     uniqs.sort()  # pyright: ignore[reportCallIssue]  # TODO?
     return uniqs
 
@@ -757,8 +768,16 @@ class ColumnNamer:
 
 class SimpleShredder(Traversible):
     """ Iterator to recursively extract data from nested containers. """
+    HAS_STRIP = TypeHasMethod("strip")  # Whether each type is string-like
+    HAS_VALUES = TypeHasMethod("values")  # Whether each type is Mapping-like
     SHRED_ERRORS = (AttributeError, TypeError)
 
+    # Builtin containers without a __dict__, and the unshreddable types that
+    # need no stripping, to save leaves without checking if they're iterable
+    # and to save all of a container's elements at once if they're all leaves
+    FLAT_TYPES = frozenset({frozenset, list, set, tuple})
+    LEAF_TYPES = frozenset({bool, complex, float, int, type(None)})
+
     def __init__(self) -> None:
         """ Reset; clear traversal record by removing all collected parts. """
         Traversible.__init__(self)
@@ -772,42 +791,82 @@ class SimpleShredder(Traversible):
         :param an_obj: Any, object to return the parts of.
         :return: set of the particular Hashable non-Container data in an_obj
         """
-        try:  # If it's a string/bytes, then it's not shreddable, so save it
-            self.parts.add(cast(str | bytes | bytearray, an_obj).strip())
-        except self.SHRED_ERRORS:
-
-            try:  # If it's a non-str Iterable, then shred it
-                iter(an_obj)
-                self._shred_iterable(an_obj)
-
-            # Hashable but not Iterable means not shreddable, so save it
-            except TypeError:
-                self.parts.add(an_obj)
+        # Stack of iterators over the contents of each container being
+        # shredded, so nested containers are shredded depth-first in order
+        # without recursion (and therefore without any recursion limit)
+        to_shred: list[Iterator] = [iter((an_obj, ))]
+        # Look these up once per shred instead of once per part
+        has_strip = self.HAS_STRIP
+        leaf_types = self.LEAF_TYPES
+        save = self.parts.add
+        shred_iterable = self._shred_iterable
+        try:
+            while to_shred:
+                depth = len(to_shred)
+                for each_obj in to_shred[-1]:
+                    obj_type = type(each_obj)
+
+                    # If it's a number or None, skip checking if it's iterable
+                    if obj_type in leaf_types:
+                        save(each_obj)
+
+                    # If it's a string/bytes, it's not shreddable, so save it
+                    elif has_strip[obj_type]:
+                        save(cast(str | bytes | bytearray, each_obj).strip())
+                    else:
+                        try:  # If it's a non-str Iterable, then shred it
+                            iter(each_obj)
+                        except TypeError:  # Hashable, not Iterable: save it
+                            save(each_obj)
+                        else:
+                            shred_iterable(each_obj, to_shred)
+
+                            # Finish shredding its contents before continuing
+                            if len(to_shred) > depth:
+                                break
+                else:  # Every element of the top container was shredded
+                    to_shred.pop()
+        finally:
+            self._done_traversing()
         return self.parts
 
-    def _shred_iterable(self, an_obj: Iterable) -> None:
-        """ Save every item in an Iterable regardless of how deeply nested, \
-            unless that item is "shreddable" (a non-string data container).
+    def _shred_iterable(self, an_obj: Iterable, to_shred: list[Iterator]
+                        ) -> None:
+        """ Queue every item in an Iterable to be shredded, unless this \
+            shredder already traversed that Iterable.
 
         :param an_obj: Iterable to save the "shreddable" elements of.
+        :param to_shred: list[Iterator], stack of iterators over the items \
+            of each container that is currently being shredded.
         """
         # If we already shredded it, then don't shred it again
-        if self._will_now_traverse(an_obj):
+        if self._will_now_traverse(an_obj) and not self._save_leaves(an_obj):
 
-            try:  # If it has a __dict__, then shred that
-                self._shred_iterable(an_obj.__dict__)
+            # Shred or save each of an_obj's values if it's a Mapping, else
+            # its elements; check its type instead of raising & catching
+            contents = iter(cast(Mapping, an_obj).values()) \
+                if self.HAS_VALUES[type(an_obj)] else iter(an_obj)
+
+            try:  # If it has a __dict__, then shred that first
+                contents = itertools.chain((an_obj.__dict__, ), contents)
             except self.SHRED_ERRORS:
                 pass
 
-            # Shred or save each of an_obj's...
-            try:  # ...values if it's a Mapping
-                for v in cast(Mapping, an_obj).values():
-                    self.shred(v)
-            except self.SHRED_ERRORS:
+            to_shred.append(contents)
 
-                # ...elements if it's not a Mapping
-                for element in an_obj:
-                    self.shred(element)
+    def _save_leaves(self, an_obj: Iterable) -> bool:
+        """ Save all of an Iterable's elements in one step if it is a builtin \
+            container with no elements to shred or strip.
+
+        :param an_obj: Iterable to save the elements of.
+        :return: bool, True if all of `an_obj`'s elements were saved; else \
+            False if `an_obj` still needs to be shredded
+        """
+        is_flat = type(an_obj) in self.FLAT_TYPES and \
+            set(map(type, an_obj)) <= self.LEAF_TYPES
+        if is_flat:
+            self.parts.update(an_obj)
+        return is_flat
 
     reset = __init__
 
@@ -985,4 +1044,7 @@ class MapWalker[KT: Hashable, VT: Any](Traversible, IterableMap[KT, VT]):
             the key-value pairings in this Mapping and all of the nested \
             Mapping values, iterating recursively.
         """
-        yield from self._walk(None, self.root, only_yield_maps)
+        try:
+            yield from self._walk(None, self.root, only_yield_maps)
+        finally:
+            self._done_traversing()
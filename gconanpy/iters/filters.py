@@ -5,7 +5,7 @@ Classes that can filter objects to only get the elements (or attributes) \
     that match certain specified conditions.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-09-18
-Updated: 2026-05-04
+Updated: 2026-10-18
 """
 # Import standard libraries
 import abc
@@ -181,7 +181,22 @@ class MapSubset[KT, VT](BaseFilter):
         :return: Mapping, `from_map` subset including only the specified \
             keys and values
         """
-        filtered = {k: v for k, v in from_map.items() if self(k, v)}
+        if self.values[True] or self.values[False]:
+            filtered = {k: v for k, v in from_map.items() if self(k, v)}
+        else:  # Only filter on keys, so skip calling self on every pair
+            include = self.keys[True]
+            exclude = self.keys[False]
+            if not include and not exclude:
+                filtered = dict(from_map)
+            else:
+                try:  # Check whether each key is selected in O(1) time
+                    include = frozenset(include)
+                    exclude = frozenset(exclude)
+                except TypeError:  # ...unless the key filters are unhashable
+                    pass
+                filtered = {k: v for k, v in from_map.items()
+                            if (not include or k in include)
+                            and k not in exclude}
         if as_type is None:
             as_type = type(from_map)
         return as_type(filtered)
@@ -4,7 +4,7 @@
 Useful/convenient custom extensions of Python's dictionary class.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-01-23
-Updated: 2026-05-04
+Updated: 2026-10-18
 """
 # Import standard libraries
 from argparse import ArgumentParser
@@ -484,11 +484,14 @@ class DotDict[KT: str, VT](Updationary[KT, VT], Traversible):
         :param replace: type of element/child/attribute to change to DotDict.
         """
         cls = type(self)
-        for k, v in self.items():
-            if self._will_now_traverse(v) and isinstance(v, replace):
-                if not isinstance(v, cls):
-                    self[k] = cls(v)
-                cast(DotDict, self[k]).homogenize()
+        try:
+            for k, v in self.items():
+                if self._will_now_traverse(v) and isinstance(v, replace):
+                    if not isinstance(v, cls):
+                        self[k] = cls(v)
+                    cast(DotDict, self[k]).homogenize()
+        finally:
+            self._done_traversing()
 
     def lookup(self, path: str, sep: str = ".", default: _D = None) -> VT | _D:
         """ Get the value mapped to a key in nested structure. Adapted from \
@@ -4,7 +4,7 @@
 Functions/classes to manipulate, define, and/or be manipulated by others.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-03-26
-Updated: 2026-05-08
+Updated: 2026-10-18
 """
 # Import standard libraries
 import abc
@@ -349,6 +349,30 @@ class Boolable(metaclass=BoolableMeta):
     """ Any object that you can call `bool()` on is a `Boolable`. """
 
 
+class TypeHasMethod(dict[type, bool]):
+    """ Cache of whether each type has a certain method, so checking \
+        whether an object has that method only takes 1 `dict` lookup.
+        `TypeHasMethod("strip")[type(x)]` means `has_method(type(x), "strip")`.
+    """
+
+    def __init__(self, method_name: str) -> None:
+        """
+        :param method_name: str, name of the method that each `type` key \
+            might have.
+        """
+        super().__init__()
+        self.method_name = method_name
+
+    def __missing__(self, a_type: type) -> bool:
+        """ Check whether `a_type` has the method and cache the result.
+
+        :param a_type: type that might have a `method_name` method.
+        :return: bool, True if `a_type` has a `method_name` method; else False
+        """
+        self[a_type] = has_it = has_method(a_type, self.method_name)
+        return has_it
+
+
 class Traversible:
     """ Base class for recursive iterators that can visit all items in a \
         nested container data structure. """
@@ -356,15 +380,25 @@ class Traversible:
     def __init__(self) -> None:
         self.traversed: set[int] = set()
 
+        # Objects visited during the current traversal, kept alive so that
+        # their IDs can't be reused by different objects mid-traversal
+        self.traversing: list[Any] = list()
+
+    def _done_traversing(self) -> None:
+        """ Release the objects visited during the finished traversal. """
+        self.traversing.clear()
+
     def _will_now_traverse(self, an_obj: Any) -> bool:
         """
         :param an_obj: Any, object to recursively visit while traversing
         :return: bool, False if `an_obj` was already visited, else True
         """
         objID = id(an_obj)
-        not_traversed = objID not in self.traversed
+        if objID in self.traversed:
+            return False
         self.traversed.add(objID)
-        return not_traversed
+        self.traversing.append(an_obj)
+        return True
 
 
 class Recursively:
@@ -510,6 +544,9 @@ class KeepTryingUntilNoErrors(KeepSkippingExceptions):
 class IteratorFactory:
     _T = TypeVar("_T")
 
+    # Builtin types whose elements are iterated without trying .values()
+    SEQUENCE_TYPES = frozenset({frozenset, list, set, str, tuple})
+
     @classmethod
     def first_element_of(cls, an_obj: Iterable[_T] | _T) -> _T:
         """ Get `an_obj`'s first element if `an_obj` is iterable; \
@@ -529,14 +566,20 @@ class IteratorFactory:
         :param an_obj: Iterable to iterate over, or Any.
         :return: Iterator over `an_obj` or its elements/values.
         """
-        with KeepTryingUntilNoErrors(*DATA_ERRORS) as next_try:
-            with next_try():
-                iterator = iter(an_obj.values())
-            with next_try():
-                iterator = iter(an_obj)
-            with next_try():
-                iterator = iter([an_obj])
-        return iterator
+        # Skip raising & catching exceptions for the most common types
+        obj_type = type(an_obj)
+        if obj_type is dict:
+            return iter(an_obj.values())
+        if obj_type in cls.SEQUENCE_TYPES:
+            return iter(an_obj)
+
+        try:
+            return iter(an_obj.values())
+        except DATA_ERRORS:
+            try:
+                return iter(an_obj)
+            except DATA_ERRORS:
+                return iter((an_obj, ))
 
 
 class Comparer(IteratorFactory):
@@ -547,7 +590,11 @@ class Comparer(IteratorFactory):
     ToNumber = Callable[[Comparable], SupportsFloat]  # Sizer function
     ToComparable = Callable[[Comparee], Comparable]   # Sizer metafunction
 
+    # Types of sizes that builtin min/max can compare without `comparison`
+    NUMBER_TYPES = frozenset({bool, float, int})
+
     @classmethod
+    @functools.cache  # Only 4 possible results, so only make each one once
     def comparison(cls, smallest: bool = False, earliest: bool = False
                    ) -> Comparison:
         """ Get function that compares two `SupportsFloat` objects.
@@ -603,11 +650,32 @@ class Comparer(IteratorFactory):
         """
         if not items:
             raise ValueError("No items for Comparer.compare to compare!")
+
+        # Sizes from the default functions are ints (or 1.0), so builtin
+        # min/max can compare them in C instead of calling `compare` on each
+        if compare_their is len and make_comparable is str:
+            # min/max keep the 1st tie, so reverse to get the last
+            if not earliest:
+                items = reversed(list(items))
+            choose = min if smallest else max
+            return choose(items, key=functools.partial(
+                cls.size_of, get_size=len, make_comparable=str))
+
+        # Size every item once; if all sizes are plain numbers, then compare
+        # them in C by choosing the index of the biggest (or smallest) size
+        items = list(items)
+        sizes = [cls.size_of(item, compare_their, make_comparable)
+                 for item in items]
+        if set(map(type, sizes)) <= cls.NUMBER_TYPES:
+            indices = range(len(sizes)) if earliest else \
+                range(len(sizes) - 1, -1, -1)
+            choose = min if smallest else max
+            return items[choose(indices, key=sizes.__getitem__)]
+
         compare = cls.comparison(smallest, earliest)
-        biggest = cls.first_element_of(items)
-        max_size = cls.size_of(biggest, compare_their, make_comparable)
-        for item in items:
-            item_size = cls.size_of(item, compare_their, make_comparable)
+        biggest = items[0]
+        max_size = sizes[0]
+        for item, item_size in zip(items, sizes):
             if compare(item_size, max_size):  # item_size >= max_size:
                 biggest = item
                 max_size = item_size
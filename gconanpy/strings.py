@@ -4,7 +4,7 @@
 FancyString class wraps builtin str class to add extra string functionality.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-05-04
-Updated: 2026-05-01
+Updated: 2026-10-18
 """
 # Import standard libraries
 # from collections import UserString  # TODO?
@@ -514,6 +514,14 @@ class FancyString(str, metaclass=MethodWrappingMeta):
             quoted = cls(an_obj)
         else:
             match an_obj:
+                # Check the most common leaf types before slower abstract ones
+                case str():
+                    quoted = cls(an_obj).enclosed_by(quote)
+                case None:
+                    quoted = cls().enclosed_by(quote)
+                case Number():
+                    quoted = cls(an_obj).enclosed_by(quote) \
+                        if quote_numbers else cls(an_obj)
                 case Mapping():
                     quoted = cls.fromMapping(an_obj, quote, quote_numbers,
                                              quote_keys, **iter_kwargs)
@@ -529,11 +537,6 @@ class FancyString(str, metaclass=MethodWrappingMeta):
                     quoted = cls.fromIterable(
                         an_obj,  # type: ignore  # TODO FIX NonTxtCollection
                         quote, quote_numbers=quote_numbers, **iter_kwargs)
-                case Number():
-                    quoted = cls(an_obj).enclosed_by(quote) \
-                        if quote_numbers else cls(an_obj)
-                case None:
-                    quoted = cls().enclosed_by(quote)
                 case _:
                     quoted = cls(an_obj).enclosed_by(quote)
         return quoted
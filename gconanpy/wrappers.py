@@ -4,7 +4,7 @@
 Classes that wrap other classes, especially builtins, to add functionality.
 Greg Conan: gregmconan@gmail.com
 Created: 2025-05-04
-Updated: 2026-04-08
+Updated: 2026-10-18
 """
 # Import standard libraries
 from collections.abc import Callable, Generator, \
@@ -324,5 +324,11 @@ class Sets[T: Hashable](IterTuple[set[T]]):
         :return: Generator[set[T], None, None], each set with only its
             unique items
         """
-        return (self[i].difference((self[:i] + self[i+1:]).union()
-                                   ) for i in range(len(self)))
+        # Find every element in more than 1 set in a single pass, instead of
+        # rebuilding (and copying) the other Sets' union for each set
+        seen = set[T]()
+        shared = set[T]()
+        for each_set in self:
+            shared.update(seen.intersection(each_set))
+            seen.update(each_set)
+        return (each_set.difference(shared) for each_set in self)
@@ -15,6 +15,7 @@ import itertools
 import operator
 import random
 import string
+import sys
 from timeit import timeit
 from typing import Any, cast
 
@@ -23,9 +24,10 @@ import bs4
 
 # Import local custom libraries
 from gconanpy.access import attributes
-from gconanpy.access.find import iterfind, modifind, ReadyChecker, \
-    Spliterator, UntilFound
-from gconanpy.access.nested import Corer, DifferenceBetween, Shredder, Xray
+from gconanpy.access.find import BasicRange, ErrIterChecker, iterfind, \
+    modifind, ReadyChecker, Spliterator, UntilFound
+from gconanpy.access.nested import Corer, DifferenceBetween, Peeler, \
+    Shredder, Xray
 from gconanpy.debug import ShowTimeTaken
 from gconanpy.iters import SimpleShredder
 from gconanpy.iters.filters import MapSubset
@@ -223,6 +225,13 @@ class TestAttrsOf(Tester):
             for _, meth in attributes.AttrsOf(each_type).methods():
                 assert callable(meth)
 
+    def test_nested(self) -> None:
+        self.add_basics()
+        attrs = attributes.AttrsOf(self.adict)
+        self.check_result(attrs.nested("get", "__name__"), "get")
+        self.check_result(attrs.nested("get", "nonexistent", "__name__"),
+                          None)
+
     def test_public(self) -> None:
         for each_type in self.EXAMPLE_TYPES:
             for name, _ in attributes.AttrsOf(each_type).public():
@@ -301,6 +310,16 @@ class TestDifferenceBetween(Tester):
         for i in range(len(expected_diffs)):
             self.check_result(a_diff.diffs[i], expected_diffs[i])
 
+    def test_nan(self):
+        nan = float("nan")  # nan != nan, but the same nan object "is" itself
+        self.check_diff(DifferenceBetween([nan, 1], [nan, 2]),
+                        "element 1", 1, 2)
+
+    def test_names(self):
+        a_diff = DifferenceBetween(1, 2, "a", 3, int2=4, str1="b")
+        self.check_result(a_diff.names, ["int2", "str1", "int1", "int3",
+                                            "str2", "int4"])
+
     def test_no_diff(self):
         self.add_basics()
         for x in (self.alist, self.adict, self, 1, None, "the"):
@@ -343,15 +362,64 @@ class TestDifferenceBetween(Tester):
         assert sub_diff.difference
         assert sub_diff.difference.startswith("unique attribute(s)")
 
+    def test_value_diff(self):
+        self.add_basics()
+        otherdict = self.adict.copy()
+        for key, value in self.adict.items():
+            otherdict[key] = 270
+            dict_diff = DifferenceBetween(self.adict, otherdict)
+            self.check_diff(dict_diff, f"value {key}", value, 270)
+            otherdict[key] = value
+
 
 class TestIterFind(Tester):
     """ Test `gconanpy/access/find.py` functions and classes """
+    def test_BasicRange(self):
+        self.add_basics()
+        self.check_result(list(BasicRange(self.alist)), self.alist)
+        self.check_result(list(BasicRange(self.alist, 1, 3)),
+                          self.alist[1:4])
+        self.check_result(list(BasicRange(self.alist, 3, 1)),
+                          self.alist[3:0:-1])
+        self.check_result(list(BasicRange(self.alist, step=2)),
+                          self.alist[::2])
+        polled = list()
+        backwards = BasicRange(self.alist, 3, 1)
+        while backwards.is_iterating:
+            polled.append(next(backwards))
+        self.check_result(polled, self.alist[3:0:-1])
+
+    def test_ErrIterChecker(self):
+        checker = ErrIterChecker([{}, {"b": 2}, {"a": 1}, {"a": 3}],
+                                 False, KeyError)
+        while checker.is_not_ready():
+            with checker:
+                found = next(checker)["a"]
+                checker.is_done = True
+        self.check_result(found, 1)
+        self.check_result(len(checker.errors), 2)
+        assert iter(checker) is checker
+
+    def test_checkers_iter_from_current_ix(self):
+        alist = [1, 2, 3, 4]
+        checkers = (ErrIterChecker(alist),
+                    ReadyChecker(None, alist, callable))
+        for checker in checkers:
+            assert iter(checker) is checker
+            self.check_result(next(checker), 1)
+            self.check_result(list(checker), [2, 3, 4])
+            assert not checker.is_iterating
+
     def test_iterfind(self):
         self.add_basics()
         for eachnum in self.alist:
             bigger = iterfind(self.alist, operator.gt, [eachnum],
                               default=max(self.alist) + 1)
             self.check_result(bigger, eachnum + 1)
+            bigger = iterfind(self.alist, lambda x, y: x > y,
+                              found_kwargs={"y": eachnum},
+                              default=max(self.alist) + 1)
+            self.check_result(bigger, eachnum + 1)
 
     def test_UntilFound(self):
         self.add_basics()
@@ -388,6 +456,36 @@ class TestModifind(Tester):
                               default="wrong")
             self.validatedate(gotten)
 
+    def test_modifind_skips_errs(self):
+        self.check_result(modifind(["a", None, 3, 5], modify=lambda x: x + 1,
+                                   found_if=lambda x: x > 3), 4)
+        self.check_result(modifind([None, None], default="none"), "none")
+
+    def test_modifind_errs(self):
+        def modify(x: Any) -> Any:
+            if x == "stop":
+                raise RuntimeError(x)
+            return {"a": x}[x]  # KeyError unless x == "a"
+
+        # Subclasses of the errors to catch are caught too
+        self.check_result(modifind(["b", "a"], modify=modify,
+                                   errs=(LookupError, )), "a")
+
+        # No errs means the default data errors, not every exception
+        self.check_result(modifind(["b", "a"], modify=modify, errs=[]), "a")
+        try:
+            modifind(["stop", "a"], modify=modify, errs=[])
+            raise AssertionError("modifind swallowed a RuntimeError")
+        except RuntimeError:
+            pass
+
+    def test_modifind_args(self):
+        self.check_result(modifind([1, 2, 3], modify=operator.mul,
+                                   modify_args=[10], found_if=operator.gt,
+                                   found_args=[15]), 20)
+        self.check_result(modifind([1, 2, 3], found_if=lambda x, lo, hi:
+                                   lo < x < hi, found_args=(1, 3)), 2)
+
     def validatedate(self, date_obj: Any):
         assert isinstance(date_obj, dt.date)
         assert date_obj.year == 2025
@@ -396,6 +494,19 @@ class TestModifind(Tester):
         print(f"Validated {date_obj}")
 
 
+class TestPeeler(Tester):
+    """ Test `Peeler` class in `gconanpy/access/nested.py` """
+
+    def test_peel(self):
+        peeler = Peeler()
+        self.check_result(peeler.peel([[("x", )]]), "x")
+        self.check_result(peeler.peel({"a": [{"b": 5}]}), 5)
+        self.check_result(peeler.peel([["a", "b"]]), ["a", "b"])
+        self.check_result(peeler.peel(["abc"]), "abc")
+        self.check_result(peeler.peel([7]), 7)
+        self.check_result(peeler.peel([]), [])
+
+
 class TestReadyChecker(Tester):
     """ Test `ReadyChecker` class in `gconanpy/access/find.py` """
     REMOVABLES = (", Extra.", "Extra", "A.B.C", "ABC", "The")
@@ -411,6 +522,17 @@ class TestReadyChecker(Tester):
                                       " ").strip())
             self.check_result(check.to_check, result)
 
+    def test_ready_checker_args(self):
+        with ReadyChecker("xyz", "xyz", str.__contains__, "w") as check:
+            while check.is_not_ready():
+                check(check.to_check.replace(next(check), "w"))
+        self.check_result(check.to_check, "wyz")
+        with ReadyChecker("xyz", "xyz", lambda x, y: y not in x, y="y"
+                          ) as check:
+            while check.is_not_ready():
+                check(check.to_check.replace(next(check), ""))
+        self.check_result(check.to_check, "z")
+
 
 class TestShredders(Tester):
     """ Test `Shredder` classes in `gconanpy/access/nested.py` and \
@@ -433,6 +555,40 @@ class TestShredders(Tester):
                 for shreddable in shreddables:
                     assert not isinstance(chunk, shreddable)
 
+    def test_3(self):
+        depth = sys.getrecursionlimit() * 2  # Too deep to shred recursively
+        nested: list = ["core"]
+        for i in range(depth):
+            nested = [i, nested]
+        for shredder in (SimpleShredder(), Shredder(max_shreds=depth + 2)):
+            shredded = shredder.shred(nested)
+            assert "core" in shredded
+            self.check_result(len(shredded), depth + 1)
+
+    def test_4(self):
+        class MakesNewLists:
+            """ Iterable whose elements are only referenced while shredded """
+
+            def __iter__(self):
+                return ([i] for i in range(100))
+
+        for shredder_type in self.TEST_CLASSES:
+            self.check_result(shredder_type().shred(MakesNewLists()),
+                              set(range(100)))
+
+    def test_5(self):
+        shredder = Shredder(max_shreds=3)
+        self.check_result(shredder.shred([[1], [2], [3], [4]]), {1, 2})
+        self.check_result(len(shredder.traversed), 3)
+
+    def test_6(self):
+        nested = [[1, [2, {"a": (3, 4)}]], {5, 6}]
+        for shredder_type in self.TEST_CLASSES:
+            shredder = shredder_type()
+            self.check_result(shredder.shred(nested), {1, 2, 3, 4, 5, 6})
+            assert shredder.traversed  # Remembered for reset_first=False
+            self.check_result(shredder.traversing, [])  # but not kept alive
+
 
 class TestSpliterator(Tester):
     """ Test `Spliterator` class in `gconanpy/access/find.py` """
@@ -446,9 +602,27 @@ class TestSpliterator(Tester):
         self.check_result(spliterator.spliterate(["Hello", "World"])[0],
                           "Hello")
 
+    def test_spliterate_3(self):
+        spliterator = Spliterator(max_len=8)
+        parts = ["ab", "cd", "ef", "gh"]
+        self.check_result(spliterator.spliterate(
+            parts.copy(), join_on="--")[0], "ab--cd")
+        self.check_result(spliterator.spliterate(
+            parts.copy(), join_on="--", pop_ix=0)[0], "ef--gh")
+
 
 class TestXray(Tester):
     """ Test `Xray` class in `gconanpy/access/nested.py` """
+    def test_list_its(self):
+        self.check_result(Xray([1, 2], "elements"), [1, 2])
+        self.check_result(Xray(lambda: [3], "results"), [3])
+        self.check_result(Xray([1, 2], "unknown"), [1, 2])  # contents
+        try:
+            Xray(5, "unknown")
+            raise AssertionError("Xray(5, 'unknown') should raise TypeError")
+        except TypeError:
+            pass
+
     def test_repr_recursion_err(self):
         class Dummy:
             def __init__(self, txt: str, start: int, end: int):
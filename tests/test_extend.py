@@ -9,7 +9,7 @@ Updated: 2025-07-06
 from collections.abc import Iterable
 
 # Import local custom libraries
-from gconanpy.extend import weak_dataclass
+from gconanpy.extend import initialize, signature_of, weak_dataclass
 from gconanpy.testers import Tester
 
 
@@ -44,16 +44,29 @@ class TestExtend(Tester):
         class Parent(Person):
             children: list[Person]
 
-        err_msg = "__init__() missing {} required positional argument"
-        err_1 = err_msg.format(1) + ": 'name'"
-        self.check_args_err(Person, TypeError, err_1)
-        self.check_args_err(Sibling, TypeError, err_1)
-        err_2 = err_msg.format(2) + "s: 'name' and 'children'"
+        err_msg = "{}.__init__() missing {} required positional argument"
+        err_1 = ": 'name'"
+        self.check_args_err(Person, TypeError,
+                            err_msg.format("Person", 1) + err_1)
+        self.check_args_err(Sibling, TypeError,
+                            err_msg.format("Sibling", 1) + err_1)
+        err_2 = err_msg.format("Parent", 2) + "s: 'name' and 'children'"
         self.check_args_err(Parent, TypeError, err_2)
 
         for person_class in (Person, Sibling, Parent):
             self.check_args_err(person_class, TypeError, wrong="WRONG")
 
+        for person_class in (Person, Sibling, Parent):
+            init = person_class.__init__
+            self.check_result(init.__module__, "gconanpy.extend")
+            self.check_result(init.__qualname__,
+                              person_class.__qualname__ + ".__init__")
+
+        # Class attribute defaults still resolve on each weak_dataclass
+        for person_class in (Person, Sibling, Parent):
+            self.check_result(person_class.age, 21)
+        self.check_result(Sibling.siblings, 0)
+
         james = Sibling("James", siblings=1)
         jim = Parent("Jimothy", [james])
         self.check_result(len(jim.children), 1)
@@ -62,3 +75,45 @@ class TestExtend(Tester):
             "age=21, siblings=1)"
         self.check_result(str(james), jamesstr)
         assert jim != james
+        assert james == Sibling("James", siblings=1)
+        assert james != Sibling("James", siblings=2)
+        assert jim != "Jimothy"
+
+    def test_weak_dataclass_slots(self) -> None:
+        @weak_dataclass
+        class Point:
+            __slots__ = ()  # No __dict__
+            x: int
+            y: int = 0
+
+        point = Point(1)
+        self.check_result(str(point), "Point(x=1, y=0)")
+        assert not hasattr(point, "__dict__")
+        point.y = 2
+        self.check_result(point, Point(1, 2))
+
+    def test_initialize(self) -> None:
+        class Pair:
+            __slots__ = ("a", "b")
+
+        pair = Pair()
+        initialize(pair, 1, a=9, b=2)
+        self.check_result((pair.a, pair.b), (1, 2))
+        try:
+            initialize(Pair(), 1, 2, 3)
+            raise AssertionError("initialize ignored an extra argument")
+        except TypeError:
+            pass
+
+    def test_signature_of(self) -> None:
+        class Unhashable:
+            __hash__ = None  # type: ignore
+
+            def __call__(self, a: int, b: int = 1) -> int:
+                return a + b
+
+        for _ in range(2):  # Also check with (possibly) cached signatures
+            self.check_result(list(signature_of(Unhashable()).parameters),
+                              ["a", "b"])
+            self.check_result(list(signature_of(initialize).parameters),
+                              ["self", "args", "kwargs"])
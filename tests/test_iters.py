@@ -3,7 +3,7 @@
 """
 Greg Conan: gregmconan@gmail.com
 Created: 2025-07-06
-Updated: 2026-04-10
+Updated: 2026-10-18
 """
 # Import standard libraries
 import random
@@ -23,6 +23,16 @@ class TestMapSubset(Tester):
         self.check_result(subsetter.of(self.adict),
                           dict(a=1, b=2))
 
+    def test_keys_arent(self) -> None:
+        self.add_basics()
+        for keys_arent in (("a", "b"), (["a"], "a", "b")):  # Unhashable too
+            subsetter = MapSubset(keys_arent=keys_arent)
+            self.check_result(subsetter.of(self.adict), dict(c=3))
+
+    def test_no_filters(self) -> None:
+        self.add_basics()
+        self.check_result(MapSubset().of(self.adict), self.adict)
+
 
 class TestMerge(Tester):
     MIN = 1    # Default minimum number of items/tests
@@ -20,14 +20,29 @@ from gconanpy.debug import StrictlyTime
 from gconanpy.iters import Combinations
 from gconanpy.mapping.dicts import Cryptionary, CustomDict, DotDict, \
     ExcluDict, LazyDict, LazyDotDict
-from gconanpy.meta import Boolable, name_of, names_of, \
-    Recursively, TimeSpec
+from gconanpy.meta import Boolable, Comparer, name_of, names_of, \
+    Recursively, TimeSpec, TypeHasMethod
 # from gconanpy.meta.access import ACCESS, Access
 from gconanpy.meta.metaclass import MakeMetaclass, name_type_class
 from gconanpy.meta.typeshed import MultiTypeMeta
 from gconanpy.testers import Tester
 
 
+class TestComparer(Tester):
+    ITEMS = ("ab", "cd", 1234, "x", None, (1, 2))
+
+    class Size(float):
+        """ Non-builtin number type for Comparer to compare with methods """
+
+    def test_compare(self) -> None:
+        expected = {(False, False): None, (False, True): 1234,
+                    (True, False): "x", (True, True): "x"}
+        for sizer in (len, lambda x: len(x), lambda x: self.Size(len(x))):
+            for (smallest, earliest), result in expected.items():
+                self.check_result(Comparer.compare(
+                    self.ITEMS, sizer, str, smallest, earliest), result)
+
+
 class TestMetaClasses(Tester):
     _T = TypeVar("_T")
 
@@ -58,6 +73,15 @@ class TestMetaClasses(Tester):
     def test_TimeSpec(self) -> None:
         spec = TimeSpec()  # TODO?
 
+    def test_TypeHasMethod(self) -> None:
+        has_strip = TypeHasMethod("strip")
+        for _ in range(2):  # Check before and after caching each result
+            for a_type in (str, bytes, bytearray):
+                assert has_strip[a_type]
+            for a_type in (int, list, dict, type(None)):
+                assert not has_strip[a_type]
+        self.check_result(len(has_strip), 7)
+
 
 class TestMetaFunctions(Tester):
     DISJOINT_CLASSES: set[type] = {